@@ -1,13 +1,88 @@
-from flask import Flask, request, jsonify
+from quart import Quart, Response, request, jsonify
+from quart.json.provider import DefaultJSONProvider
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
-import json
+import aiosqlite
+import numpy as np
+import orjson
 import os
 import re
+import sqlite3
+import time
 
-app = Flask(__name__)
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson's C encoder/decoder"""
+
+    def dumps(self, object_, **kwargs):
+        return orjson.dumps(object_, default=str).decode()
+
+    def loads(self, object_, **kwargs):
+        return orjson.loads(object_)
+
+app = Quart(__name__)
+app.json = OrjsonProvider(app)
 
 users_db = {}
 meals_db = []
+meals_by_user = defaultdict(list)
+meals_by_user_date = defaultdict(lambda: defaultdict(list))
+
+NUTRIENTS = ("calories", "protein", "carbs", "fiber")
+
+def zero_nutrition():
+    return {"calories": 0, "protein": 0, "carbs": 0, "fiber": 0}
+
+user_totals = defaultdict(zero_nutrition)
+user_daily_totals = defaultdict(lambda: defaultdict(zero_nutrition))
+
+# user -> (expiry time, date the entry was built for, encoded response body)
+STATUS_TTL = 5.0
+status_cache = {}
+
+@dataclass(slots=True)
+class Meal:
+    """Compact meal record with flat nutrient fields"""
+    userId: str
+    mealType: str
+    foodItems: list
+    date: str
+    loggedAt: str
+    calories: float
+    protein: float
+    carbs: float
+    fiber: float
+
+    def to_dict(self):
+        """API/persistence form with the nutrients nested under 'nutrition'"""
+        return {
+            "userId": self.userId,
+            "mealType": self.mealType,
+            "foodItems": self.foodItems,
+            "nutrition": {
+                "calories": self.calories,
+                "protein": self.protein,
+                "carbs": self.carbs,
+                "fiber": self.fiber
+            },
+            "date": self.date,
+            "loggedAt": self.loggedAt
+        }
+
+    @classmethod
+    def from_dict(cls, d):
+        nutrition = d.get('nutrition') or {}
+        return cls(
+            userId=d['userId'],
+            mealType=d['mealType'],
+            foodItems=d['foodItems'],
+            date=d.get('date') or d['loggedAt'][:10],
+            loggedAt=d['loggedAt'],
+            calories=nutrition.get('calories', 0),
+            protein=nutrition.get('protein', 0),
+            carbs=nutrition.get('carbs', 0),
+            fiber=nutrition.get('fiber', 0)
+        )
 
 food_db = {
     "Jeera Rice": {"calories": 250, "protein": 5, "carbs": 45, "fiber": 2},
@@ -20,23 +95,181 @@ food_db = {
     "Rice": {"calories": 205, "protein": 4, "carbs": 45, "fiber": 1}
 }
 
-def save_data():
-    """Save data to JSON files"""
-    with open('users.json', 'w') as f:
-        json.dump(users_db, f, indent=2)
-    with open('meals.json', 'w') as f:
-        json.dump(meals_db, f, indent=2, default=str)
+# food_db flattened to name -> (calories, protein, carbs, fiber) tuples so
+# the hot accumulation loop does plain adds instead of nested dict lookups
+FOOD_TUPLES = {
+    name: (v['calories'], v['protein'], v['carbs'], v['fiber'])
+    for name, v in food_db.items()
+}
+
+# Vectorized mirror of FOOD_TUPLES: name -> row index into an (N, 4) table.
+# Item lists longer than the threshold are summed in NumPy; below it the
+# scalar loop wins because the array call overhead dominates.
+FOOD_INDEX = {name: i for i, name in enumerate(food_db)}
+FOOD_TABLE = np.array(
+    [[v['calories'], v['protein'], v['carbs'], v['fiber']] for v in food_db.values()],
+    dtype=np.float32
+)
+VECTOR_THRESHOLD = 32
+
+WEBHOOK_RE = re.compile(r'log\s+(breakfast|lunch|dinner|snack):\s*(.+)')
+
+# Response bodies for the two fully static endpoints, encoded once at import
+HOME_RESPONSE = orjson.dumps({
+    "message": "Nutrition Tracker API is running",
+    "endpoints": [
+        "POST /register - Register a new user",
+        "POST /log_meals - Log a meal",
+        "GET /meals/<user> - Get user's meal history",
+        "GET /meals/<user>/<date> - Get user's meals for specific date",
+        "GET /status/<user> - Get user's nutrition status",
+        "POST /webhook - WhatsApp-like webhook for meal logging"
+    ]
+})
+FOOD_DB_RESPONSE = orjson.dumps({
+    "message": "Available food items in database",
+    "total_items": len(food_db),
+    "food_items": food_db
+})
+
+DB_PATH = 'nutrition.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users(
+    name TEXT PRIMARY KEY,
+    age REAL,
+    weight REAL,
+    height REAL,
+    gender TEXT,
+    goal TEXT,
+    bmr REAL,
+    registered_at TEXT
+);
+CREATE TABLE IF NOT EXISTS meals(
+    id INTEGER PRIMARY KEY,
+    user TEXT,
+    type TEXT,
+    date TEXT,
+    logged_at TEXT,
+    items TEXT,
+    cal REAL,
+    pro REAL,
+    carbs REAL,
+    fib REAL
+);
+CREATE INDEX IF NOT EXISTS ix_meals_user_date ON meals(user, date);
+"""
+
+USER_COLUMNS = ('name', 'age', 'weight', 'height', 'gender', 'goal', 'bmr', 'registered_at')
+
+INSERT_USER_SQL = (
+    "INSERT OR REPLACE INTO users(name, age, weight, height, gender, goal, bmr, registered_at) "
+    "VALUES(?, ?, ?, ?, ?, ?, ?, ?)"
+)
+INSERT_MEAL_SQL = (
+    "INSERT INTO meals(user, type, date, logged_at, items, cal, pro, carbs, fib) "
+    "VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+_db = None  # aiosqlite connection shared by the request handlers
+
+def user_row(user_data):
+    return tuple(user_data[column] for column in USER_COLUMNS)
+
+def meal_row(meal):
+    return (meal.userId, meal.mealType, meal.date, meal.loggedAt,
+            orjson.dumps(meal.foodItems).decode(),
+            meal.calories, meal.protein, meal.carbs, meal.fiber)
+
+async def insert_user(user_data):
+    """Persist a user record"""
+    await _db.execute(INSERT_USER_SQL, user_row(user_data))
+    await _db.commit()
+
+async def insert_meal(meal):
+    """Persist a meal record"""
+    await _db.execute(INSERT_MEAL_SQL, meal_row(meal))
+    await _db.commit()
+
+async def insert_user_and_meal(user_data, meal):
+    """Persist an auto-registered user and their meal under a single commit"""
+    await _db.execute(INSERT_USER_SQL, user_row(user_data))
+    await _db.execute(INSERT_MEAL_SQL, meal_row(meal))
+    await _db.commit()
+
+def _import_legacy_json(conn):
+    """One-time import of users.json/meals.json written by older versions"""
+    if os.path.exists('users.json'):
+        with open('users.json', 'rb') as f:
+            conn.executemany(INSERT_USER_SQL, [
+                user_row(user_data) for user_data in orjson.loads(f.read()).values()
+            ])
+    if os.path.exists('meals.json'):
+        with open('meals.json', 'rb') as f:
+            conn.executemany(INSERT_MEAL_SQL, [
+                meal_row(Meal.from_dict(d)) for d in orjson.loads(f.read())
+            ])
+
+def index_meal(meal):
+    """Add a meal entry to the indexes and running nutrition totals"""
+    username = meal.userId
+    date_key = meal.date
+    meals_by_user[username].append(meal)
+    meals_by_user_date[username][date_key].append(meal)
+
+    totals = user_totals[username]
+    daily = user_daily_totals[username][date_key]
+    totals['calories'] += meal.calories
+    totals['protein'] += meal.protein
+    totals['carbs'] += meal.carbs
+    totals['fiber'] += meal.fiber
+    daily['calories'] += meal.calories
+    daily['protein'] += meal.protein
+    daily['carbs'] += meal.carbs
+    daily['fiber'] += meal.fiber
+
+def rebuild_indexes():
+    """Rebuild the meal indexes and totals from meals_db in a single pass"""
+    meals_by_user.clear()
+    meals_by_user_date.clear()
+    user_totals.clear()
+    user_daily_totals.clear()
+    for meal in meals_db:
+        index_meal(meal)
+
+# mtime of the database file at the last cache warm, keyed by path
+_last_mtimes = {}
 
 def load_data():
-    """Load data from JSON files"""
+    """Initialise the SQLite store and warm the in-memory caches from it"""
     global users_db, meals_db
     try:
-        if os.path.exists('users.json'):
-            with open('users.json', 'r') as f:
-                users_db = json.load(f)
-        if os.path.exists('meals.json'):
-            with open('meals.json', 'r') as f:
-                meals_db = json.load(f)
+        if os.path.exists(DB_PATH) and _last_mtimes.get(DB_PATH) == os.stat(DB_PATH).st_mtime:
+            return
+        conn = sqlite3.connect(DB_PATH)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        if conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 0 and \
+                conn.execute("SELECT COUNT(*) FROM meals").fetchone()[0] == 0:
+            _import_legacy_json(conn)
+        conn.commit()
+
+        users_db = {
+            row[0]: dict(zip(USER_COLUMNS, row))
+            for row in conn.execute(f"SELECT {', '.join(USER_COLUMNS)} FROM users")
+        }
+        meals_db = [
+            Meal(userId=user, mealType=meal_type, foodItems=orjson.loads(items),
+                 date=date, loggedAt=logged_at,
+                 calories=cal, protein=pro, carbs=carbs, fiber=fib)
+            for user, meal_type, date, logged_at, items, cal, pro, carbs, fib
+            in conn.execute(
+                "SELECT user, type, date, logged_at, items, cal, pro, carbs, fib "
+                "FROM meals ORDER BY id")
+        ]
+        conn.close()
+        rebuild_indexes()
+        _last_mtimes[DB_PATH] = os.stat(DB_PATH).st_mtime
     except Exception as e:
         print(f"Error loading data: {e}")
 
@@ -49,240 +282,251 @@ def calculate_bmr(gender, weight, height, age):
     else:
         raise ValueError("Gender must be 'male' or 'female'")
 
+REQUIRED_FIELDS = ('name', 'age', 'weight', 'height', 'gender', 'goal')
+
+# (field, label, min, max, error suffix) for each numeric registration field
+NUMERIC_FIELD_SPEC = (
+    ('age', 'Age', 0, 150, 'between 1 and 150'),
+    ('weight', 'Weight', 0, 500, 'between 1 and 500 kg'),
+    ('height', 'Height', 0, 300, 'between 1 and 300 cm'),
+)
+
 def validate_user_data(data):
-    """Validate user registration data"""
-    required_fields = ['name', 'age', 'weight', 'height', 'gender', 'goal']
+    """Validate user registration data, returning (errors, parsed values)"""
     errors = []
-    
-    for field in required_fields:
+    parsed = {}
+
+    for field in REQUIRED_FIELDS:
         if field not in data or not data[field]:
             errors.append(f"{field} is required")
-    
-    if 'age' in data:
-        try:
-            age = float(data['age'])
-            if age <= 0 or age > 150:
-                errors.append("Age must be between 1 and 150")
-        except ValueError:
-            errors.append("Age must be a valid number")
-    
-    if 'weight' in data:
-        try:
-            weight = float(data['weight'])
-            if weight <= 0 or weight > 500:
-                errors.append("Weight must be between 1 and 500 kg")
-        except ValueError:
-            errors.append("Weight must be a valid number")
-    
-    if 'height' in data:
+
+    if errors:
+        return errors, parsed
+
+    for field, label, lo, hi, range_text in NUMERIC_FIELD_SPEC:
         try:
-            height = float(data['height'])
-            if height <= 0 or height > 300:
-                errors.append("Height must be between 1 and 300 cm")
-        except ValueError:
-            errors.append("Height must be a valid number")
-    
-    if 'gender' in data and data['gender'].lower() not in ['male', 'female']:
+            value = float(data[field])
+        except (TypeError, ValueError):
+            errors.append(f"{label} must be a valid number")
+            continue
+        if value <= lo or value > hi:
+            errors.append(f"{label} must be {range_text}")
+        else:
+            parsed[field] = value
+
+    gender = data['gender'].lower()
+    if gender not in ('male', 'female'):
         errors.append("Gender must be 'male' or 'female'")
-    
-    return errors
+    else:
+        parsed['gender'] = gender
+
+    return errors, parsed
+
+def nutrition_dict(values):
+    """Map a (calories, protein, carbs, fiber) tuple to its API dict form"""
+    return dict(zip(NUTRIENTS, values))
 
 def calculate_nutrition(food_items):
-    """Calculate total nutrition for given food items"""
-    total_nutrition = {"calories": 0, "protein": 0, "carbs": 0, "fiber": 0}
-    
+    """Calculate total nutrition for given food items as a nutrient tuple"""
+    if len(food_items) > VECTOR_THRESHOLD:
+        idxs = [FOOD_INDEX[item] for item in food_items if item in FOOD_INDEX]
+        if not idxs:
+            return (0, 0, 0, 0)
+        return tuple(FOOD_TABLE[idxs].sum(axis=0).tolist())
+
+    calories = protein = carbs = fiber = 0
+
     for item in food_items:
-        if item in food_db:
-            nutrition = food_db[item]
-            for nutrient in total_nutrition:
-                total_nutrition[nutrient] += nutrition[nutrient]
-    
-    return total_nutrition
+        values = FOOD_TUPLES.get(item)
+        if values:
+            calories += values[0]
+            protein += values[1]
+            carbs += values[2]
+            fiber += values[3]
+
+    return (calories, protein, carbs, fiber)
 
 # API Endpoints
 
+@app.before_serving
+async def startup():
+    """Load persisted data and open the write connection before serving"""
+    global _db
+    load_data()
+    _db = await aiosqlite.connect(DB_PATH)
+
+@app.after_serving
+async def shutdown():
+    """Close the write connection on clean shutdown"""
+    if _db is not None:
+        await _db.close()
+
 @app.route('/', methods=['GET'])
-def home():
+async def home():
     """Health check endpoint"""
-    return jsonify({
-        "message": "Nutrition Tracker API is running",
-        "endpoints": [
-            "POST /register - Register a new user",
-            "POST /log_meals - Log a meal",
-            "GET /meals/<user> - Get user's meal history",
-            "GET /meals/<user>/<date> - Get user's meals for specific date",
-            "GET /status/<user> - Get user's nutrition status",
-            "POST /webhook - WhatsApp-like webhook for meal logging"
-        ]
-    })
+    return Response(HOME_RESPONSE, mimetype='application/json')
 
 @app.route('/register', methods=['POST'])
-def register_user():
+async def register_user():
     """Register a new user"""
     try:
-        data = request.get_json()
-        
+        data = await request.get_json()
+
         if not data:
             return jsonify({"error": "No data provided"}), 400
-        
-        validation_errors = validate_user_data(data)
+
+        validation_errors, parsed = validate_user_data(data)
         if validation_errors:
             return jsonify({"error": "Validation failed", "details": validation_errors}), 400
-        
+
         username = data['name'].strip()
         if username in users_db:
             return jsonify({"error": "User already exists"}), 409
-        
+
         bmr = calculate_bmr(
-            data['gender'], 
-            float(data['weight']), 
-            float(data['height']), 
-            float(data['age'])
+            parsed['gender'],
+            parsed['weight'],
+            parsed['height'],
+            parsed['age']
         )
-        
+
         user_data = {
             "name": username,
-            "age": float(data['age']),
-            "weight": float(data['weight']),
-            "height": float(data['height']),
-            "gender": data['gender'].lower(),
+            "age": parsed['age'],
+            "weight": parsed['weight'],
+            "height": parsed['height'],
+            "gender": parsed['gender'],
             "goal": data['goal'],
             "bmr": round(bmr, 2),
             "registered_at": datetime.now().isoformat()
         }
-        
+
         users_db[username] = user_data
-        save_data()
-        
+        await insert_user(user_data)
+
         return jsonify({
             "message": "User registered successfully",
             "user": user_data
         }), 201
-        
+
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/log_meals', methods=['POST'])
-def log_meals():
+async def log_meals():
     """Log a meal for a user"""
     try:
-        data = request.get_json()
-        
+        data = await request.get_json()
+
         if not data:
             return jsonify({"error": "No data provided"}), 400
-        
+
         required_fields = ['user', 'meal', 'items']
         for field in required_fields:
             if field not in data:
                 return jsonify({"error": f"{field} is required"}), 400
-        
+
         username = data['user'].strip()
         meal_type = data['meal'].strip().lower()
         food_items = data['items']
-        
+
         if username not in users_db:
             return jsonify({"error": "User not found"}), 404
-        
+
         valid_meals = ['breakfast', 'lunch', 'dinner', 'snack']
         if meal_type not in valid_meals:
             return jsonify({"error": f"Meal type must be one of: {valid_meals}"}), 400
-        
+
         if not isinstance(food_items, list) or len(food_items) == 0:
             return jsonify({"error": "Items must be a non-empty array"}), 400
-        
+
         nutrition = calculate_nutrition(food_items)
-        
-        meal_entry = {
-            "userId": username,
-            "mealType": meal_type.capitalize(),
-            "foodItems": food_items,
-            "nutrition": nutrition,
-            "loggedAt": datetime.now().isoformat()
-        }
-        
+        now_iso = datetime.now().isoformat()
+
+        meal_entry = Meal(
+            userId=username,
+            mealType=meal_type.capitalize(),
+            foodItems=food_items,
+            date=now_iso[:10],
+            loggedAt=now_iso,
+            calories=nutrition[0],
+            protein=nutrition[1],
+            carbs=nutrition[2],
+            fiber=nutrition[3]
+        )
+
         meals_db.append(meal_entry)
-        save_data()
-        
+        index_meal(meal_entry)
+        status_cache.pop(username, None)
+        await insert_meal(meal_entry)
+
         return jsonify({
             "message": "Meal logged successfully",
-            "meal": meal_entry
+            "meal": meal_entry.to_dict()
         }), 201
-        
+
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/meals/<user>', methods=['GET'])
-def get_user_meals(user):
+async def get_user_meals(user):
     """Get all meals for a specific user"""
     try:
         if user not in users_db:
             return jsonify({"error": "User not found"}), 404
-        
-        user_meals = [meal for meal in meals_db if meal['userId'] == user]
-        
+
+        user_meals = meals_by_user.get(user, [])
+
         return jsonify({
             "user": user,
             "total_meals": len(user_meals),
-            "meals": user_meals
+            "meals": [meal.to_dict() for meal in user_meals]
         }), 200
-        
+
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/meals/<user>/<date>', methods=['GET'])
-def get_user_meals_by_date(user, date):
+async def get_user_meals_by_date(user, date):
     """Get meals for a specific user on a specific date (YYYY-MM-DD)"""
     try:
         if user not in users_db:
             return jsonify({"error": "User not found"}), 404
-        
-        user_meals = []
-        for meal in meals_db:
-            if meal['userId'] == user:
-                meal_date = meal['loggedAt'][:10]
-                if meal_date == date:
-                    user_meals.append(meal)
-        
+
+        user_meals = meals_by_user_date.get(user, {}).get(date, [])
+
         return jsonify({
             "user": user,
             "date": date,
             "total_meals": len(user_meals),
-            "meals": user_meals
+            "meals": [meal.to_dict() for meal in user_meals]
         }), 200
-        
+
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/status/<user>', methods=['GET'])
-def get_user_status(user):
+async def get_user_status(user):
     """Get nutrition status for a user"""
     try:
         if user not in users_db:
             return jsonify({"error": "User not found"}), 404
-        
-        user_data = users_db[user]
-        user_meals = [meal for meal in meals_db if meal['userId'] == user]
-        
-        total_nutrition = {"calories": 0, "protein": 0, "carbs": 0, "fiber": 0}
-        
-        for meal in user_meals:
-            if 'nutrition' in meal:
-                for nutrient in total_nutrition:
-                    total_nutrition[nutrient] += meal['nutrition'].get(nutrient, 0)
-        
+
         today = datetime.now().strftime('%Y-%m-%d')
-        today_meals = []
-        today_nutrition = {"calories": 0, "protein": 0, "carbs": 0, "fiber": 0}
-        
-        for meal in user_meals:
-            meal_date = meal['loggedAt'][:10]
-            if meal_date == today:
-                today_meals.append(meal)
-                if 'nutrition' in meal:
-                    for nutrient in today_nutrition:
-                        today_nutrition[nutrient] += meal['nutrition'].get(nutrient, 0)
-        
-        return jsonify({
+
+        cached = status_cache.get(user)
+        if cached and cached[0] > time.time() and cached[1] == today:
+            return Response(cached[2], mimetype='application/json'), 200
+
+        user_data = users_db[user]
+        user_meals = meals_by_user.get(user, [])
+
+        total_nutrition = user_totals.get(user) or zero_nutrition()
+
+        today_meals = meals_by_user_date.get(user, {}).get(today, [])
+        today_nutrition = user_daily_totals.get(user, {}).get(today) or zero_nutrition()
+
+        body = orjson.dumps({
             "user": user,
             "bmr": user_data['bmr'],
             "goal": user_data['goal'],
@@ -301,38 +545,43 @@ def get_user_status(user):
             },
             "total_meals_logged": len(user_meals),
             "meals_today": len(today_meals)
-        }), 200
-        
+        })
+        status_cache[user] = (time.time() + STATUS_TTL, today, body)
+
+        return Response(body, mimetype='application/json'), 200
+
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/webhook', methods=['POST'])
-def webhook():
+async def webhook():
     """WhatsApp-like webhook for meal logging"""
     try:
-        data = request.get_json()
-        
+        data = await request.get_json()
+
         if not data or 'message' not in data:
             return jsonify({"error": "Message is required"}), 400
-        
+
         message = data['message'].strip().lower()
         user = data.get('user', 'default_user')
-        
-        pattern = r'log\s+(breakfast|lunch|dinner|snack):\s*(.+)'
-        match = re.match(pattern, message)
-        
+
+        match = WEBHOOK_RE.match(message)
+
         if not match:
             return jsonify({
                 "error": "Invalid message format. Use: 'log [meal_type]: [food items]'",
                 "example": "log lunch: Jeera Rice, Dal, Cucumber"
             }), 400
-        
+
         meal_type = match.group(1)
         food_items_str = match.group(2)
         food_items = [item.strip() for item in food_items_str.split(',')]
-        
+
+        now_iso = datetime.now().isoformat()
+
+        new_user = None
         if user not in users_db:
-            users_db[user] = {
+            users_db[user] = new_user = {
                 "name": user,
                 "age": 25,
                 "weight": 70,
@@ -340,55 +589,63 @@ def webhook():
                 "gender": "male",
                 "goal": "maintain",
                 "bmr": calculate_bmr("male", 70, 170, 25),
-                "registered_at": datetime.now().isoformat()
+                "registered_at": now_iso
             }
-        
+
         nutrition = calculate_nutrition(food_items)
-        
-        meal_entry = {
-            "userId": user,
-            "mealType": meal_type.capitalize(),
-            "foodItems": food_items,
-            "nutrition": nutrition,
-            "loggedAt": datetime.now().isoformat()
-        }
-        
+
+        meal_entry = Meal(
+            userId=user,
+            mealType=meal_type.capitalize(),
+            foodItems=food_items,
+            date=now_iso[:10],
+            loggedAt=now_iso,
+            calories=nutrition[0],
+            protein=nutrition[1],
+            carbs=nutrition[2],
+            fiber=nutrition[3]
+        )
+
         meals_db.append(meal_entry)
-        save_data()
-        
+        index_meal(meal_entry)
+        status_cache.pop(user, None)
+        if new_user is not None:
+            await insert_user_and_meal(new_user, meal_entry)
+        else:
+            await insert_meal(meal_entry)
+
         return jsonify({
             "message": f"Meal logged successfully for {user}",
             "parsed": {
                 "meal_type": meal_type,
                 "food_items": food_items,
-                "nutrition": nutrition
+                "nutrition": nutrition_dict(nutrition)
             }
         }), 201
-        
+
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/food_db', methods=['GET'])
-def get_food_database():
+async def get_food_database():
     """Get available food items and their nutrition values"""
-    return jsonify({
-        "message": "Available food items in database",
-        "total_items": len(food_db),
-        "food_items": food_db
-    }), 200
+    return Response(FOOD_DB_RESPONSE, mimetype='application/json'), 200
 
 @app.errorhandler(404)
-def not_found(error):
+async def not_found(error):
     return jsonify({"error": "Endpoint not found"}), 404
 
 @app.errorhandler(405)
-def method_not_allowed(error):
+async def method_not_allowed(error):
     return jsonify({"error": "Method not allowed"}), 405
 
 @app.errorhandler(500)
-def internal_error(error):
+async def internal_error(error):
     return jsonify({"error": "Internal server error"}), 500
 
 if __name__ == '__main__':
-    load_data()
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    import uvicorn
+    # Workers keep independent in-memory caches; run more than one only
+    # behind a scheme that pins a user to a worker.
+    uvicorn.run('app:app', host='0.0.0.0', port=5000,
+                workers=int(os.environ.get('WEB_CONCURRENCY', 1)))